@@ -187,8 +187,17 @@ class BaseAgent(ABC):
         """Set the current task for intelligent routing context."""
         self._current_task = task
     
-    def _log(self, level: LogLevel, message: str):
-        """Log a message with agent context."""
+    def _log(self, level: LogLevel, message: str, *args: Any):
+        """
+        Log a message with agent context.
+        
+        Args:
+            level: Log level
+            message: Message, or %-style format string when args are given
+            *args: Values interpolated into the message
+        """
+        if args:
+            message = message % args
         self.project_state.add_log_entry(level, self.agent_id, message)
     
     def _create_task_id(self) -> str:
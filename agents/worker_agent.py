@@ -6,10 +6,15 @@ Workers handle specific, focused tasks delegated by Team Lead agents.
 """
 
 import asyncio
+import logging
+import time
 from abc import abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from typing import ClassVar, Dict, Any, List, Mapping, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 import uuid
+import weakref
 
 from agents.base_agent import BaseAgent, AgentType
 from core.state import Task, TaskStatus, LogLevel
@@ -48,6 +53,60 @@ class WorkerSpecialty(Enum):
     OPTIMIZATION_SPECIALIST = "optimization_specialist"
 
 
+# Shared load gauge across all live workers. Workers run on a single event
+# loop, so plain integer updates are safe without locking.
+_GLOBAL_LOAD = {"in_flight": 0, "worker_count": 0}
+
+
+def _release_worker_slot():
+    """Decrement the live worker count when a worker is collected."""
+    _GLOBAL_LOAD["worker_count"] -= 1
+
+
+# Phase 3: Specialty-specific model routing
+# Different specialties might prefer different models
+_SPECIALTY_MODEL = {
+    # Frontend specialties - Claude for UI/UX
+    WorkerSpecialty.HTML_SPECIALIST: "claude",
+    WorkerSpecialty.CSS_SPECIALIST: "claude",
+    WorkerSpecialty.JS_SPECIALIST: "claude",
+    WorkerSpecialty.REACT_SPECIALIST: "claude",
+    
+    # Backend specialties - Could use GPT for some tasks
+    WorkerSpecialty.API_SPECIALIST: "claude",
+    WorkerSpecialty.DATABASE_SPECIALIST: "claude",
+    WorkerSpecialty.AUTH_SPECIALIST: "claude",
+    WorkerSpecialty.INTEGRATION_SPECIALIST: "claude",
+    
+    # QA specialties - Could use specialized models
+    WorkerSpecialty.UNIT_TEST_SPECIALIST: "claude",
+    WorkerSpecialty.E2E_TEST_SPECIALIST: "claude",
+    WorkerSpecialty.PERFORMANCE_TEST_SPECIALIST: "claude",
+    WorkerSpecialty.SECURITY_TEST_SPECIALIST: "claude",
+    
+    # General specialties
+    WorkerSpecialty.DOCUMENTATION_SPECIALIST: "claude",
+    WorkerSpecialty.REFACTORING_SPECIALIST: "claude",
+    WorkerSpecialty.OPTIMIZATION_SPECIALIST: "claude"
+}
+
+
+def _compute_category(specialty_value: str) -> str:
+    """Map a specialty value to a general task category for LLM routing."""
+    if "test" in specialty_value:
+        return "testing"
+    elif any(x in specialty_value for x in ["html", "css", "js", "javascript", "react"]):
+        return "frontend"
+    elif any(x in specialty_value for x in ["api", "database", "auth", "integration"]):
+        return "backend"
+    else:
+        return "general"
+
+
+# Specialty to task category, evaluated once at import
+_SPECIALTY_TASK_TYPE = {specialty: _compute_category(specialty.value) for specialty in WorkerSpecialty}
+
+
 class WorkerAgent(BaseAgent):
     """
     Worker Agent for atomic task execution.
@@ -64,6 +123,50 @@ class WorkerAgent(BaseAgent):
     - Optimize for speed and quality
     """
     
+    # BaseAgent keeps its __dict__; worker-level attributes live in slots
+    __slots__ = (
+        "specialty",
+        "team_type",
+        "execution_context",
+        "performance_metrics",
+        "_metrics_view",
+        "_artifacts_dir",
+        "_artifacts_dir_ready",
+        "_agent_id_suffix",
+        "_artifact_header"
+    )
+    
+    # Default execution context; specialty and team are filled in per worker
+    _DEFAULT_EXEC_CTX: ClassVar[Dict[str, Any]] = {
+        "parallel_capable": True,
+        "atomic_execution": True,
+        "max_execution_time": 120,  # 2 minutes for atomic tasks
+        "retry_on_failure": True,
+        "quality_threshold": 0.9
+    }
+    
+    # Initial performance metric counters
+    _DEFAULT_METRICS: ClassVar[Dict[str, Any]] = {
+        "tasks_completed": 0,
+        "tasks_failed": 0,
+        "total_execution_time_ns": 0,
+        "total_tokens": 0,
+        "average_execution_time": 0.0,
+        "tokens_per_task": 0.0,
+        "quality_score": 1.0,
+        "parallel_executions": 0
+    }
+    
+    # Bounded LRU of built atomic prompts shared across workers
+    _PROMPT_CACHE: ClassVar["OrderedDict[Tuple[Any, ...], str]"] = OrderedDict()
+    _PROMPT_CACHE_SIZE: ClassVar[int] = 256
+    
+    # In-flight LLM calls keyed by (model preference, task type, prompt)
+    _INFLIGHT_PROMPTS: ClassVar[Dict[Tuple[Optional[str], str, str], asyncio.Future]] = {}
+    
+    # In-flight task attempts keyed by (project ID, task ID)
+    _INFLIGHT_TASKS: ClassVar[Dict[Tuple[str, str], asyncio.Future]] = {}
+    
     def __init__(
         self,
         agent_id: str,
@@ -98,64 +201,33 @@ class WorkerAgent(BaseAgent):
         
         self.specialty = specialty
         self.team_type = team_type
-        self.execution_context = self._initialize_execution_context()
-        self.performance_metrics = self._initialize_metrics()
+        self.execution_context = {
+            "specialty": specialty.value,
+            "team": team_type,
+            **WorkerAgent._DEFAULT_EXEC_CTX
+        }
+        self.performance_metrics = WorkerAgent._DEFAULT_METRICS.copy()
+        self._metrics_view = MappingProxyType(self.performance_metrics)
+        
+        # Artifact location and per-worker header lines are fixed for the worker's lifetime
+        self._artifacts_dir = self.config.project_dir / self.project_state.projectId / "artifacts" / "workers"
+        self._artifacts_dir_ready = False
+        self._agent_id_suffix = self.agent_id[-8:]
+        self._artifact_header = (
+            f"Worker: {self.agent_id}\n"
+            f"Specialty: {specialty.value}\n"
+            f"Team: {team_type}\n"
+        )
         
-        logger.info(f"Worker {agent_id} initialized with {specialty.value} specialty")
+        # Register in the shared load gauge for peer coordination
+        _GLOBAL_LOAD["worker_count"] += 1
+        weakref.finalize(self, _release_worker_slot)
+        
+        logger.info("Worker %s initialized with %s specialty", agent_id, specialty.value)
     
     def _get_specialty_model_preference(self, specialty: WorkerSpecialty) -> str:
         """Get preferred model for this specialty."""
-        # Phase 3: Specialty-specific model routing
-        # Different specialties might prefer different models
-        specialty_model_preferences = {
-            # Frontend specialties - Claude for UI/UX
-            WorkerSpecialty.HTML_SPECIALIST: "claude",
-            WorkerSpecialty.CSS_SPECIALIST: "claude",
-            WorkerSpecialty.JS_SPECIALIST: "claude",
-            WorkerSpecialty.REACT_SPECIALIST: "claude",
-            
-            # Backend specialties - Could use GPT for some tasks
-            WorkerSpecialty.API_SPECIALIST: "claude",
-            WorkerSpecialty.DATABASE_SPECIALIST: "claude",
-            WorkerSpecialty.AUTH_SPECIALIST: "claude",
-            WorkerSpecialty.INTEGRATION_SPECIALIST: "claude",
-            
-            # QA specialties - Could use specialized models
-            WorkerSpecialty.UNIT_TEST_SPECIALIST: "claude",
-            WorkerSpecialty.E2E_TEST_SPECIALIST: "claude",
-            WorkerSpecialty.PERFORMANCE_TEST_SPECIALIST: "claude",
-            WorkerSpecialty.SECURITY_TEST_SPECIALIST: "claude",
-            
-            # General specialties
-            WorkerSpecialty.DOCUMENTATION_SPECIALIST: "claude",
-            WorkerSpecialty.REFACTORING_SPECIALIST: "claude",
-            WorkerSpecialty.OPTIMIZATION_SPECIALIST: "claude"
-        }
-        
-        return specialty_model_preferences.get(specialty, "claude")
-    
-    def _initialize_execution_context(self) -> Dict[str, Any]:
-        """Initialize execution context for this worker."""
-        return {
-            "specialty": self.specialty.value,
-            "team": self.team_type,
-            "parallel_capable": True,
-            "atomic_execution": True,
-            "max_execution_time": 120,  # 2 minutes for atomic tasks
-            "retry_on_failure": True,
-            "quality_threshold": 0.9
-        }
-    
-    def _initialize_metrics(self) -> Dict[str, Any]:
-        """Initialize performance metrics tracking."""
-        return {
-            "tasks_completed": 0,
-            "tasks_failed": 0,
-            "average_execution_time": 0,
-            "quality_score": 1.0,
-            "parallel_executions": 0,
-            "tokens_per_task": 0
-        }
+        return _SPECIALTY_MODEL.get(specialty, "claude")
     
     async def execute_task(self, task: Task) -> bool:
         """
@@ -167,31 +239,59 @@ class WorkerAgent(BaseAgent):
         Returns:
             True if task completed successfully
         """
+        # Nothing to do for tasks that already finished
+        if task.status == TaskStatus.COMPLETE:
+            return True
+        
+        # Coalesce duplicate submissions of a task that is already running
+        key = (self.project_state.projectId, task.id)
+        pending = WorkerAgent._INFLIGHT_TASKS.get(key)
+        if pending is not None:
+            self._log(LogLevel.INFO, "Task %s already in progress, awaiting existing attempt", task.id)
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        WorkerAgent._INFLIGHT_TASKS[key] = future
+        try:
+            success = await self._execute_atomic_task(task)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; coalesced waiters see a failed attempt
+            future.set_result(False)
+            raise
+        except BaseException as e:
+            # Waiters re-raise the error; without any, it is raised here only
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            del WorkerAgent._INFLIGHT_TASKS[key]
+        
+        future.set_result(success)
+        return success
+    
+    async def _execute_atomic_task(self, task: Task) -> bool:
+        """Run a single attempt of an atomic task."""
         # Set task context for intelligent routing
         self.set_current_task(task)
+        _GLOBAL_LOAD["in_flight"] += 1
         
-        self._log(LogLevel.INFO, f"Worker {self.specialty.value} executing: {task.description}")
+        self._log(LogLevel.INFO, "Worker %s executing: %s", self.specialty.value, task.description)
         
-        start_time = asyncio.get_event_loop().time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validate task is appropriate for this worker
             if not self._validate_task_for_specialty(task):
-                self._log(LogLevel.WARNING, f"Task {task.id} may not match {self.specialty.value} specialty")
+                self._log(LogLevel.WARNING, "Task %s may not match %s specialty", task.id, self.specialty.value)
             
             # Increment attempt counter
             task.attempts += 1
             
             # Build atomic execution prompt
-            prompt = self._build_atomic_prompt(task)
+            prompt = self._get_atomic_prompt(task)
             
             # Execute with specialty expertise
-            response = await self.call_llm(
-                prompt=prompt,
-                task_type=self._map_specialty_to_task_type(),
-                expect_json=False,
-                max_retries=2  # Fewer retries for atomic tasks
-            )
+            response = await self._call_llm_shared(prompt, self._map_specialty_to_task_type())
             
             # Process and validate output
             processed_output = await self._process_atomic_output(task, response["response"])
@@ -200,25 +300,26 @@ class WorkerAgent(BaseAgent):
             await self._save_atomic_result(task, processed_output)
             
             # Update metrics
-            execution_time = asyncio.get_event_loop().time() - start_time
-            self._update_metrics(True, execution_time, response.get("metadata", {}))
+            execution_ns = time.perf_counter_ns() - start_ns
+            self._update_metrics(True, execution_ns, response.get("metadata", {}))
             
-            self._log(LogLevel.INFO, f"Atomic task completed in {execution_time:.2f}s: {task.description}")
+            self._log(LogLevel.INFO, "Atomic task completed in %.2fs: %s", execution_ns / 1e9, task.description)
             return True
             
         except Exception as e:
-            self._log(LogLevel.ERROR, f"Atomic task execution failed: {e}")
+            self._log(LogLevel.ERROR, "Atomic task execution failed: %s", e)
             task.error = str(e)
             
             # Update metrics
-            execution_time = asyncio.get_event_loop().time() - start_time
-            self._update_metrics(False, execution_time, {})
+            execution_ns = time.perf_counter_ns() - start_ns
+            self._update_metrics(False, execution_ns, {})
             
             return False
         
         finally:
             # Clear task context
             self.set_current_task(None)
+            _GLOBAL_LOAD["in_flight"] -= 1
     
     def _validate_task_for_specialty(self, task: Task) -> bool:
         """Validate that task matches worker's specialty."""
@@ -230,17 +331,72 @@ class WorkerAgent(BaseAgent):
         """Build a prompt for atomic task execution."""
         pass
     
+    def _get_atomic_prompt(self, task: Task) -> str:
+        """Get the atomic prompt for a task, reusing a cached build when possible."""
+        # Prompts embed the task description and project objective
+        key = (
+            type(self),
+            self.specialty,
+            self.project_state.objective,
+            task.description,
+            tuple(sorted(task.dependencies))
+        )
+        cache = WorkerAgent._PROMPT_CACHE
+        prompt = cache.get(key)
+        if prompt is not None:
+            cache.move_to_end(key)
+            return prompt
+        
+        prompt = self._build_atomic_prompt(task)
+        cache[key] = prompt
+        if len(cache) > WorkerAgent._PROMPT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return prompt
+    
+    async def _call_llm_shared(self, prompt: str, task_type: str) -> Dict[str, Any]:
+        """
+        Call the LLM, sharing one request among workers co-executing the same prompt.
+        
+        Args:
+            prompt: Atomic task prompt
+            task_type: Task type for LLM routing
+            
+        Returns:
+            LLM response dictionary
+        """
+        key = (self.model_preference, task_type, prompt)
+        pending = WorkerAgent._INFLIGHT_PROMPTS.get(key)
+        if pending is not None:
+            self._log(LogLevel.INFO, "Joining in-flight LLM call for identical prompt")
+            response = await asyncio.shield(pending)
+            # Tokens were spent by the originating call only
+            return {**response, "metadata": {}}
+        
+        future = asyncio.get_running_loop().create_future()
+        WorkerAgent._INFLIGHT_PROMPTS[key] = future
+        try:
+            response = await self.call_llm(
+                prompt=prompt,
+                task_type=task_type,
+                expect_json=False,
+                max_retries=2  # Fewer retries for atomic tasks
+            )
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure isn't reported as unhandled
+            future.exception()
+            raise
+        finally:
+            del WorkerAgent._INFLIGHT_PROMPTS[key]
+    
     def _map_specialty_to_task_type(self) -> str:
         """Map specialty to task type for LLM routing."""
-        # Map specialties to general categories
-        if "test" in self.specialty.value:
-            return "testing"
-        elif any(x in self.specialty.value for x in ["html", "css", "js", "react"]):
-            return "frontend"
-        elif any(x in self.specialty.value for x in ["api", "database", "auth", "integration"]):
-            return "backend"
-        else:
-            return "general"
+        return _SPECIALTY_TASK_TYPE[self.specialty]
     
     async def _process_atomic_output(self, task: Task, output: str) -> str:
         """Process output from atomic task execution."""
@@ -250,21 +406,19 @@ class WorkerAgent(BaseAgent):
     async def _save_atomic_result(self, task: Task, output: str):
         """Save atomic task result."""
         try:
-            # Create artifacts directory
-            project_dir = self.config.project_dir / self.project_state.projectId
-            artifacts_dir = project_dir / "artifacts" / "workers"
-            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            # Create artifacts directory once per worker
+            if not self._artifacts_dir_ready:
+                self._artifacts_dir.mkdir(parents=True, exist_ok=True)
+                self._artifacts_dir_ready = True
             
             # Create artifact file with worker context
-            artifact_filename = f"{task.id}_{self.specialty.value}_{self.agent_id[-8:]}.txt"
-            artifact_path = artifacts_dir / artifact_filename
+            artifact_filename = f"{task.id}_{self.specialty.value}_{self._agent_id_suffix}.txt"
+            artifact_path = self._artifacts_dir / artifact_filename
             
             # Write output to artifact file
             with open(artifact_path, 'w', encoding='utf-8') as f:
                 f.write(f"Task: {task.description}\n")
-                f.write(f"Worker: {self.agent_id}\n")
-                f.write(f"Specialty: {self.specialty.value}\n")
-                f.write(f"Team: {self.team_type}\n")
+                f.write(self._artifact_header)
                 f.write(f"Generated: {self.project_state.updatedAt}\n")
                 f.write("-" * 50 + "\n")
                 f.write(output)
@@ -272,32 +426,30 @@ class WorkerAgent(BaseAgent):
             # Add artifact to task
             task.artifacts.append(str(artifact_path))
             
-            self._log(LogLevel.INFO, f"Saved atomic result: {artifact_filename}")
+            self._log(LogLevel.INFO, "Saved atomic result: %s", artifact_filename)
             
         except Exception as e:
-            self._log(LogLevel.WARNING, f"Failed to save atomic result: {e}")
+            self._log(LogLevel.WARNING, "Failed to save atomic result: %s", e)
     
-    def _update_metrics(self, success: bool, execution_time: float, metadata: Dict[str, Any]):
+    def _update_metrics(self, success: bool, execution_ns: int, metadata: Dict[str, Any]):
         """Update performance metrics."""
+        metrics = self.performance_metrics
         if success:
-            self.performance_metrics["tasks_completed"] += 1
+            metrics["tasks_completed"] += 1
         else:
-            self.performance_metrics["tasks_failed"] += 1
+            metrics["tasks_failed"] += 1
         
-        # Update average execution time
-        total_tasks = self.performance_metrics["tasks_completed"] + self.performance_metrics["tasks_failed"]
-        current_avg = self.performance_metrics["average_execution_time"]
-        self.performance_metrics["average_execution_time"] = (
-            (current_avg * (total_tasks - 1) + execution_time) / total_tasks
-        )
+        metrics["total_execution_time_ns"] += execution_ns
+        metrics["total_tokens"] += metadata.get("tokens_used", 0)
         
-        # Update tokens per task
-        tokens_used = metadata.get("tokens_used", 0)
-        if tokens_used > 0:
-            current_tokens = self.performance_metrics["tokens_per_task"]
-            self.performance_metrics["tokens_per_task"] = (
-                (current_tokens * (total_tasks - 1) + tokens_used) / total_tasks
-            )
+        # Averages are derived from the exact totals, not updated incrementally
+        total_tasks = metrics["tasks_completed"] + metrics["tasks_failed"]
+        metrics["average_execution_time"] = metrics["total_execution_time_ns"] / 1e9 / total_tasks
+        metrics["tokens_per_task"] = metrics["total_tokens"] / total_tasks
+    
+    def _average_execution_time(self) -> float:
+        """Get average execution time per task in seconds."""
+        return self.performance_metrics["average_execution_time"]
     
     def get_capabilities(self) -> List[str]:
         """Get worker capabilities."""
@@ -310,15 +462,21 @@ class WorkerAgent(BaseAgent):
             "quality_validation"
         ]
     
-    def get_performance_metrics(self) -> Dict[str, Any]:
-        """Get current performance metrics."""
+    def get_performance_metrics(self) -> Mapping[str, Any]:
+        """Get a live read-only view of current performance metrics."""
+        return self._metrics_view
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a mutable copy of current performance metrics."""
         return self.performance_metrics.copy()
     
     async def can_execute_parallel(self, task: Task) -> bool:
         """Check if this worker can execute task in parallel."""
         # Check if task has no blocking dependencies
         if task.dependencies:
-            for dep_id in task.dependencies:
+            pending = set(task.dependencies) - self.project_state.completed_task_ids
+            # Dependencies unknown to the project state don't block execution
+            for dep_id in pending:
                 dep_task = self.project_state.get_task(dep_id)
                 if dep_task and dep_task.status != TaskStatus.COMPLETE:
                     return False
@@ -331,29 +489,28 @@ class WorkerAgent(BaseAgent):
     
     async def execute_parallel(self, tasks: List[Task]) -> List[bool]:
         """Execute multiple tasks in parallel."""
-        self._log(LogLevel.INFO, f"Worker {self.agent_id} executing {len(tasks)} tasks in parallel")
+        self._log(LogLevel.INFO, "Worker %s executing %d tasks in parallel", self.agent_id, len(tasks))
         
         # Track parallel executions
         self.performance_metrics["parallel_executions"] = len(tasks)
         
-        # Execute tasks concurrently
-        results = await asyncio.gather(
-            *[self.execute_task(task) for task in tasks],
-            return_exceptions=True
-        )
+        # Bound concurrency so large task lists don't flood the event loop
+        semaphore = asyncio.Semaphore(self._get_optimal_batch_size())
+        
+        async def run_bounded(task: Task) -> bool:
+            async with semaphore:
+                # A coalesced attempt can re-raise its error to every waiter
+                try:
+                    return await self.execute_task(task)
+                except Exception as e:
+                    self._log(LogLevel.ERROR, "Parallel task %s failed: %s", task.id, e)
+                    return False
+        
+        success_results = await asyncio.gather(*[run_bounded(task) for task in tasks])
         
         # Reset parallel execution count
         self.performance_metrics["parallel_executions"] = 0
         
-        # Process results
-        success_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self._log(LogLevel.ERROR, f"Parallel task {tasks[i].id} failed: {result}")
-                success_results.append(False)
-            else:
-                success_results.append(result)
-        
         return success_results
     
     # Phase 4: Enhanced concurrency capabilities
@@ -369,9 +526,9 @@ class WorkerAgent(BaseAgent):
         Returns:
             Execution results and metrics
         """
-        self._log(LogLevel.INFO, f"Worker {self.agent_id} executing {len(tasks)} tasks in batches of {batch_size}")
+        self._log(LogLevel.INFO, "Worker %s executing %d tasks in batches of %d", self.agent_id, len(tasks), batch_size)
         
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         all_results = []
         batch_metrics = {
             "total_tasks": len(tasks),
@@ -385,9 +542,11 @@ class WorkerAgent(BaseAgent):
         # Process tasks in batches
         for i in range(0, len(tasks), batch_size):
             batch = tasks[i:i + batch_size]
-            batch_start = asyncio.get_event_loop().time()
+            batch_start = time.perf_counter()
             
-            self._log(LogLevel.DEBUG, f"Processing batch {batch_metrics['batches_processed'] + 1} with {len(batch)} tasks")
+            # Project state logs have no DEBUG level; keep per-batch progress on the module logger
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing batch %d with %d tasks", batch_metrics["batches_processed"] + 1, len(batch))
             
             # Execute batch
             batch_results = await self.execute_parallel(batch)
@@ -398,24 +557,20 @@ class WorkerAgent(BaseAgent):
             batch_metrics["successful_tasks"] += sum(1 for r in batch_results if r)
             batch_metrics["failed_tasks"] += sum(1 for r in batch_results if not r)
             
-            batch_time = asyncio.get_event_loop().time() - batch_start
+            batch_time = time.perf_counter() - batch_start
             batch_metrics["average_batch_time"] = (
                 (batch_metrics["average_batch_time"] * (batch_metrics["batches_processed"] - 1) + batch_time) /
                 batch_metrics["batches_processed"]
             )
-            
-            # Brief pause between batches to allow resource recovery
-            if i + batch_size < len(tasks):
-                await asyncio.sleep(0.1)
         
         # Calculate overall metrics
-        total_time = asyncio.get_event_loop().time() - start_time
+        total_time = time.perf_counter() - start_time
         batch_metrics["total_execution_time"] = total_time
         batch_metrics["resource_efficiency"] = self._calculate_resource_efficiency(batch_metrics)
         
         self._log(LogLevel.INFO, 
-                 f"Batch execution completed: {batch_metrics['successful_tasks']}/{batch_metrics['total_tasks']} successful, "
-                 f"{total_time:.1f}s total time")
+                 "Batch execution completed: %d/%d successful, %.1fs total time",
+                 batch_metrics["successful_tasks"], batch_metrics["total_tasks"], total_time)
         
         return {
             "results": all_results,
@@ -435,6 +590,10 @@ class WorkerAgent(BaseAgent):
     
     async def check_resource_availability(self) -> Dict[str, Any]:
         """Check current resource availability for concurrency decisions."""
+        return self._snapshot_resources()
+    
+    def _snapshot_resources(self) -> Dict[str, Any]:
+        """Take a synchronous snapshot of resource availability."""
         # Simulate resource checking (in real implementation, would check actual system resources)
         return {
             "memory_available": True,
@@ -448,7 +607,7 @@ class WorkerAgent(BaseAgent):
     def _get_optimal_batch_size(self) -> int:
         """Calculate optimal batch size based on current performance."""
         # Base batch size on recent performance
-        avg_time = self.performance_metrics.get("average_execution_time", 30.0)
+        avg_time = self._average_execution_time()
         
         if avg_time < 10.0:
             return 5  # Fast tasks can be batched more
@@ -470,61 +629,55 @@ class WorkerAgent(BaseAgent):
         if not peer_workers:
             return {"coordination_needed": False}
         
-        # Analyze peer performance
-        peer_metrics = []
-        for peer in peer_workers:
-            if hasattr(peer, 'performance_metrics'):
-                peer_metrics.append({
-                    "worker_id": peer.agent_id,
-                    "specialty": getattr(peer, 'specialty', 'unknown'),
-                    "current_load": peer.performance_metrics.get("parallel_executions", 0),
-                    "average_time": peer.performance_metrics.get("average_execution_time", 0)
-                })
-        
         # Determine coordination strategy
         coordination = {
-            "coordination_needed": len(peer_metrics) > 0,
-            "peer_count": len(peer_metrics),
+            "coordination_needed": True,
+            "peer_count": len(peer_workers),
             "recommended_actions": [],
             "load_balancing_suggestion": None
         }
         
-        if peer_metrics:
-            # Check for load imbalance
-            loads = [pm["current_load"] for pm in peer_metrics]
-            my_load = self.performance_metrics.get("parallel_executions", 0)
-            
-            avg_load = (sum(loads) + my_load) / (len(loads) + 1)
-            
-            if my_load > avg_load * 1.5:
-                coordination["recommended_actions"].append("reduce_load")
-                coordination["load_balancing_suggestion"] = "defer_new_tasks"
-            elif my_load < avg_load * 0.5:
-                coordination["recommended_actions"].append("accept_more_load")
-                coordination["load_balancing_suggestion"] = "accept_additional_tasks"
+        # Check for load imbalance against the shared gauge instead of scanning peers
+        my_load = self.performance_metrics.get("parallel_executions", 0)
+        avg_load = _GLOBAL_LOAD["in_flight"] / max(1, _GLOBAL_LOAD["worker_count"])
+        
+        if my_load > avg_load * 1.5:
+            coordination["recommended_actions"].append("reduce_load")
+            coordination["load_balancing_suggestion"] = "defer_new_tasks"
+        elif my_load < avg_load * 0.5:
+            coordination["recommended_actions"].append("accept_more_load")
+            coordination["load_balancing_suggestion"] = "accept_additional_tasks"
         
         return coordination
     
-    async def execute_with_resource_monitoring(self, task: Task) -> Tuple[bool, Dict[str, Any]]:
+    async def execute_with_resource_monitoring(
+        self, 
+        task: Task, 
+        monitor: bool = True
+    ) -> Tuple[bool, Dict[str, Any]]:
         """
         Execute task with detailed resource monitoring.
         
         Args:
             task: Task to execute
+            monitor: Whether to capture resource snapshots and build the full report
             
         Returns:
             Tuple of (success, resource_usage_report)
         """
         # Check resources before execution
-        pre_resources = await self.check_resource_availability()
-        start_time = asyncio.get_event_loop().time()
+        pre_resources = self._snapshot_resources() if monitor else None
+        start_time = time.perf_counter()
         
         # Execute task
         success = await self.execute_task(task)
         
+        execution_time = time.perf_counter() - start_time
+        if not monitor:
+            return success, {"execution_time": execution_time, "success": success}
+        
         # Check resources after execution
-        post_resources = await self.check_resource_availability()
-        execution_time = asyncio.get_event_loop().time() - start_time
+        post_resources = self._snapshot_resources()
         
         # Generate resource usage report
         resource_report = {
@@ -544,7 +697,7 @@ class WorkerAgent(BaseAgent):
             return 0.0
         
         # Efficiency based on speed compared to average
-        avg_time = self.performance_metrics.get("average_execution_time", 30.0)
+        avg_time = self._average_execution_time()
         if avg_time > 0:
             time_efficiency = min(1.0, avg_time / execution_time)
         else:
@@ -567,7 +720,7 @@ class WorkerAgent(BaseAgent):
             recommendations.append("Consider smaller batch sizes to conserve tokens")
         
         # Check execution time
-        avg_time = self.performance_metrics.get("average_execution_time", 30.0)
+        avg_time = self._average_execution_time()
         if execution_time > avg_time * 1.5:
             recommendations.append("Task took longer than average, check for optimization opportunities")
         
@@ -585,7 +738,7 @@ class WorkerAgent(BaseAgent):
             "current_parallel_executions": self.performance_metrics.get("parallel_executions", 0),
             "max_parallel_capacity": 3,
             "can_accept_more_tasks": self.performance_metrics.get("parallel_executions", 0) < 3,
-            "average_execution_time": self.performance_metrics.get("average_execution_time", 0),
+            "average_execution_time": self._average_execution_time(),
             "success_rate": self._calculate_success_rate(),
             "optimal_batch_size": self._get_optimal_batch_size(),
             "resource_efficiency": self.performance_metrics.get("resource_efficiency", 100.0)
@@ -628,6 +781,6 @@ class WorkerAgent(BaseAgent):
             # Currently executing in parallel
             optimizations["applied_optimizations"].append("parallel_execution_monitoring")
         
-        self._log(LogLevel.INFO, f"Worker optimization applied: {optimizations['applied_optimizations']}")
+        self._log(LogLevel.INFO, "Worker optimization applied: %s", optimizations['applied_optimizations'])
         
         return optimizations
\ No newline at end of file
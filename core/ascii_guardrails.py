@@ -6,21 +6,79 @@ compatibility with Windows CLI and subprocess communication.
 """
 
 import re
+import sys
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from typing import ClassVar, Optional, List, Dict, Any, Tuple, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Matches any character outside the 7-bit ASCII range
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+_NON_ASCII_BYTES_RE = re.compile(rb'[\x80-\xff]')
+
+# Appended to agent prompts by enforce_ascii_generation; interned so every
+# caller shares the one suffix object
+_ASCII_ENFORCEMENT = sys.intern("""
+
+CRITICAL ASCII-ONLY REQUIREMENT:
+- Generate ONLY ASCII characters (codes 0-127)
+- NO Unicode symbols, emojis, or extended characters
+- NO arrows like → ← ⇒, use -> <- => instead
+- NO check marks ✅ or X marks ❌, use [PASS] [FAIL] instead
+- NO status emojis 🔄 📋 ⚠️, use [PROGRESS] [INFO] [WARN] instead
+- This prevents Windows CLI encoding errors
+
+ASCII Status Symbols to Use:
+- [PASS] instead of ✅
+- [FAIL] instead of ❌  
+- [WARN] instead of ⚠️
+- [PROGRESS] instead of 🔄
+- [INFO] instead of 📋
+- [PENDING] instead of ⏳
+
+ASCII Arrows to Use:
+- -> instead of →
+- <- instead of ←
+- => instead of ⇒
+- <= instead of ≤
+- >= instead of ≥
+- != instead of ≠
+
+VERIFY: All output must pass ASCII-only validation before submission.
+""")
+
+
+@lru_cache(maxsize=32)
+def _enforce_cached(prompt: str) -> str:
+    """Append the ASCII enforcement suffix, reusing results for repeat prompts."""
+    return prompt + _ASCII_ENFORCEMENT
+
+
+def _count_non_ascii(content: str) -> int:
+    """Count non-ASCII characters without visiting them one by one."""
+    return len(content) - len(content.encode('ascii', 'ignore'))
+
 
 @dataclass
 class ASCIIViolation:
     """Represents a non-ASCII character violation."""
+    __slots__ = ('line_number', 'column', 'character', 'unicode_code')
+    
     line_number: int
     column: int
     character: str
     unicode_code: str
-    suggestion: Optional[str] = None
+    
+    # Replacement map injected by ASCIIGuardrails; read only when displayed
+    _map: ClassVar[Dict[str, str]] = {}
+    
+    @property
+    def suggestion(self) -> Optional[str]:
+        """ASCII replacement for the character, if one is known."""
+        return self._map.get(self.character)
 
 
 class ASCIIGuardrails:
@@ -31,6 +89,15 @@ class ASCIIGuardrails:
     cause encoding issues in Windows CLI subprocess communication.
     """
     
+    # Max non-ASCII inputs remembered by the validation and sanitize caches
+    _CACHE_SIZE = 64
+    
+    # Violations detailed in the log for a single agent output
+    _LOGGED_VIOLATIONS = 10
+    
+    # Max codepoints whose U+XXXX label is memoized
+    _HEX_CACHE_SIZE = 2048
+    
     def __init__(self):
         """Initialize ASCII guardrails."""
         self.enabled = True
@@ -79,45 +146,152 @@ class ASCIIGuardrails:
             '\U0001F4F1': '[MOBILE]'
         }
         
+        self._build_translation_tables()
+        ASCIIViolation._map = self.replacement_map
+        
+        # Repeated prompts/outputs hit these instead of being rescanned
+        self._validation_cache: "OrderedDict[str, Tuple[ASCIIViolation, ...]]" = OrderedDict()
+        self._sanitize_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        
+        # U+XXXX labels per codepoint, seeded with the known replacements
+        self._hex_cache: Dict[int, str] = {}
+        for unicode_seq in self.replacement_map:
+            self._hex(ord(unicode_seq[0]))
+        
         # File types to check
         self.code_extensions = {'.py', '.js', '.html', '.css', '.json', '.md', '.txt', '.yml', '.yaml'}
         
-    def validate_content(self, content: str, filename: str = "") -> Tuple[bool, List[ASCIIViolation]]:
+    def _build_translation_tables(self):
+        """Precompute the str.translate tables used by sanitize_content."""
+        # Multi-codepoint keys (emoji + variation selector) can't go through
+        # translate, so they share one alternation regex, longest first
+        self._multi_map = {
+            unicode_seq: ascii_replacement
+            for unicode_seq, ascii_replacement in self.replacement_map.items()
+            if len(unicode_seq) > 1
+        }
+        self._multi_re = re.compile('|'.join(
+            re.escape(unicode_seq) for unicode_seq in sorted(self._multi_map, key=len, reverse=True)
+        )) if self._multi_map else None
+        
+        # Single codepoints are bucketed by plane, and each bucket is a flat
+        # array covering only its occupied range (None deletes)
+        bmp: Dict[int, str] = {}
+        smp: Dict[int, str] = {}
+        for unicode_char, ascii_replacement in self.replacement_map.items():
+            if len(unicode_char) == 1:
+                codepoint = ord(unicode_char)
+                (bmp if codepoint < 0x10000 else smp)[codepoint] = ascii_replacement
+        
+        # BMP array runs from 0 (ASCII maps to itself) to the highest mapped
+        # codepoint and is handed to str.translate directly
+        self._bmp_table: List[Any] = list(range(128)) + [None] * (max(bmp, default=127) + 1 - 128)
+        for codepoint, ascii_replacement in bmp.items():
+            self._bmp_table[codepoint] = ascii_replacement
+        
+        # Supplementary-plane array spans just the mapped emoji range
+        self._smp_base = min(smp, default=0)
+        self._smp_table: List[Optional[str]] = [None] * (max(smp, default=-1) + 1 - self._smp_base)
+        for codepoint, ascii_replacement in smp.items():
+            self._smp_table[codepoint - self._smp_base] = ascii_replacement
+        
+    def _hex(self, codepoint: int) -> str:
+        """Return the U+XXXX label for a codepoint, formatting it once."""
+        label = self._hex_cache.get(codepoint)
+        if label is None:
+            if len(self._hex_cache) >= self._HEX_CACHE_SIZE:
+                self._hex_cache.clear()
+            label = self._hex_cache[codepoint] = f"U+{codepoint:04X}"
+        return label
+    
+    def _replace_multi(self, match: "re.Match") -> str:
+        """Map a matched multi-codepoint sequence."""
+        return self._multi_map[match.group()]
+    
+    def _replace_overflow(self, match: "re.Match") -> str:
+        """Map a character past the BMP table, dropping it if unknown."""
+        index = ord(match.group()) - self._smp_base
+        if 0 <= index < len(self._smp_table):
+            return self._smp_table[index] or ''
+        return ''
+        
+    def validate_content(
+        self, 
+        content: Union[str, bytes], 
+        filename: str = "", 
+        max_violations: Optional[int] = None
+    ) -> Tuple[bool, List[ASCIIViolation]]:
         """
         Validate content for ASCII-only compliance.
         
         Args:
-            content: Content to validate
+            content: Content to validate; bytes are treated as UTF-8
             filename: Optional filename for context
+            max_violations: Optional cap on violations returned; the logged
+                count always covers every non-ASCII character
             
         Returns:
             (is_valid, violations_list)
         """
-        if not self.enabled:
+        if not self.enabled or content.isascii():
             return True, []
         
-        violations = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            for col_num, char in enumerate(line, 1):
-                if ord(char) > 127:  # Non-ASCII character
-                    violation = ASCIIViolation(
-                        line_number=line_num,
-                        column=col_num,
-                        character=char,
-                        unicode_code=f"U+{ord(char):04X}",
-                        suggestion=self.replacement_map.get(char)
-                    )
-                    violations.append(violation)
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
         
-        is_valid = len(violations) == 0
+        cached = self._validation_cache.get(content)
+        if cached is not None:
+            self._validation_cache.move_to_end(content)
+            violations = list(cached[:max_violations])
+            total = len(cached)
+        elif max_violations is None:
+            cached = self._scan_violations(content)
+            self._validation_cache[content] = cached
+            if len(self._validation_cache) > self._CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+            violations = list(cached)
+            total = len(cached)
+        else:
+            # Partial scans are not cached
+            violations = list(self._scan_violations(content, max_violations))
+            total = _count_non_ascii(content)
         
-        if violations:
-            logger.warning(f"ASCII violations found in {filename or 'content'}: {len(violations)} characters")
+        is_valid = total == 0
+        
+        if total:
+            logger.warning(f"ASCII violations found in {filename or 'content'}: {total} characters")
             
         return is_valid, violations
     
+    def _scan_violations(self, content: str, limit: Optional[int] = None) -> Tuple[ASCIIViolation, ...]:
+        """Locate non-ASCII characters in content, stopping after limit if given."""
+        violations = []
+        line_num = 1
+        line_start = 0
+        last_pos = 0
+        
+        # Violations are rare, so only walk the non-ASCII matches and track
+        # line/column incrementally from the previous match
+        for match in _NON_ASCII_RE.finditer(content):
+            pos = match.start()
+            newlines = content.count('\n', last_pos, pos)
+            if newlines:
+                line_num += newlines
+                line_start = content.rfind('\n', last_pos, pos) + 1
+            last_pos = pos
+            
+            char = match.group()
+            violations.append(ASCIIViolation(
+                line_number=line_num,
+                column=pos - line_start + 1,
+                character=char,
+                unicode_code=self._hex(ord(char))
+            ))
+            if len(violations) == limit:
+                break
+        
+        return tuple(violations)
+    
     def sanitize_content(self, content: str, mode: str = "replace") -> str:
         """
         Sanitize content by removing or replacing non-ASCII characters.
@@ -129,20 +303,38 @@ class ASCIIGuardrails:
         Returns:
             Sanitized content
         """
-        if not self.enabled:
+        if not self.enabled or content.isascii():
             return content
         
+        key = (mode, content)
+        cached = self._sanitize_cache.get(key)
+        if cached is not None:
+            self._sanitize_cache.move_to_end(key)
+            return cached
+        
+        sanitized = self._sanitize_uncached(content, mode)
+        self._sanitize_cache[key] = sanitized
+        if len(self._sanitize_cache) > self._CACHE_SIZE:
+            self._sanitize_cache.popitem(last=False)
+        return sanitized
+    
+    def _sanitize_uncached(self, content: str, mode: str) -> str:
+        """Apply the sanitize mode to non-ASCII content."""
         if mode == "replace":
-            # Replace known characters with ASCII equivalents
-            for unicode_char, ascii_replacement in self.replacement_map.items():
-                content = content.replace(unicode_char, ascii_replacement)
+            # Replace known characters with ASCII equivalents and drop the
+            # rest in a single translate pass
+            if self._multi_re is not None:
+                content = self._multi_re.sub(self._replace_multi, content)
+            content = content.translate(self._bmp_table)
             
-            # Remove any remaining non-ASCII characters
-            content = ''.join(char for char in content if ord(char) <= 127)
+            # Codepoints past the end of the BMP table are left untouched by
+            # translate, so map or drop them here
+            if not content.isascii():
+                content = _NON_ASCII_RE.sub(self._replace_overflow, content)
             
         elif mode == "remove":
-            # Simply remove all non-ASCII characters
-            content = ''.join(char for char in content if ord(char) <= 127)
+            # Simply remove all non-ASCII characters in one codec pass
+            content = content.encode('ascii', errors='ignore').decode('ascii')
         
         return content
     
@@ -156,35 +348,7 @@ class ASCIIGuardrails:
         Returns:
             Enhanced prompt with ASCII enforcement
         """
-        ascii_enforcement = """
-
-CRITICAL ASCII-ONLY REQUIREMENT:
-- Generate ONLY ASCII characters (codes 0-127)
-- NO Unicode symbols, emojis, or extended characters
-- NO arrows like → ← ⇒, use -> <- => instead
-- NO check marks ✅ or X marks ❌, use [PASS] [FAIL] instead
-- NO status emojis 🔄 📋 ⚠️, use [PROGRESS] [INFO] [WARN] instead
-- This prevents Windows CLI encoding errors
-
-ASCII Status Symbols to Use:
-- [PASS] instead of ✅
-- [FAIL] instead of ❌  
-- [WARN] instead of ⚠️
-- [PROGRESS] instead of 🔄
-- [INFO] instead of 📋
-- [PENDING] instead of ⏳
-
-ASCII Arrows to Use:
-- -> instead of →
-- <- instead of ←
-- => instead of ⇒
-- <= instead of ≤
-- >= instead of ≥
-- != instead of ≠
-
-VERIFY: All output must pass ASCII-only validation before submission.
-"""
-        return agent_prompt + ascii_enforcement
+        return _enforce_cached(agent_prompt)
     
     def validate_agent_output(self, output: str, agent_name: str = "") -> Tuple[bool, str]:
         """
@@ -197,13 +361,16 @@ VERIFY: All output must pass ASCII-only validation before submission.
         Returns:
             (is_valid, sanitized_output)
         """
-        is_valid, violations = self.validate_content(output, f"{agent_name} output")
+        # Only the logged violations are materialized
+        is_valid, violations = self.validate_content(
+            output, f"{agent_name} output", max_violations=self._LOGGED_VIOLATIONS
+        )
         
         if violations:
-            logger.warning(f"Agent {agent_name} generated {len(violations)} non-ASCII characters")
+            logger.warning(f"Agent {agent_name} generated {_count_non_ascii(output)} non-ASCII characters")
             
             # Log detailed violations
-            for violation in violations[:10]:  # Limit to first 10
+            for violation in violations:
                 logger.warning(
                     f"  Line {violation.line_number}, Col {violation.column}: "
                     f"'{violation.character}' ({violation.unicode_code})"
@@ -227,6 +394,16 @@ VERIFY: All output must pass ASCII-only validation before submission.
         Returns:
             Validation report dictionary
         """
+        # Common case: nothing to enumerate or sanitize
+        if not self.enabled or content.isascii():
+            return {
+                "file_path": file_path,
+                "is_valid": True,
+                "violation_count": 0,
+                "violations": [],
+                "sanitized_content": content
+            }
+        
         is_valid, violations = self.validate_content(content, file_path)
         
         report = {
@@ -258,18 +435,21 @@ VERIFY: All output must pass ASCII-only validation before submission.
         Returns:
             Wrapped agent class with ASCII enforcement
         """
+        # Wrapped agents share this instance's lookup tables and caches
+        guardrails = self
+        
         class ASCIIEnforcedAgent(original_agent_class):
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, **kwargs)
-                self.guardrails = ASCIIGuardrails()
-            
-            async def execute_task(self, task):
-                """Execute task with ASCII enforcement."""
-                # Enhance prompts with ASCII requirements
+                self.guardrails = guardrails
+                
+                # Enhance prompts with ASCII requirements once, not per task
                 if hasattr(self, 'prompts'):
                     for key, prompt in self.prompts.items():
                         self.prompts[key] = self.guardrails.enforce_ascii_generation(prompt)
-                
+            
+            async def execute_task(self, task):
+                """Execute task with ASCII enforcement."""
                 # Execute original task
                 result = await super().execute_task(task)
                 
@@ -297,6 +477,18 @@ def validate_file_content(file_path: str, content: str) -> Dict[str, Any]:
     return ascii_guardrails.get_file_validation_report(file_path, content)
 
 
+def first_non_ascii(data: bytes) -> int:
+    """
+    Find the offset of the first non-ASCII byte, or -1 if there is none.
+    
+    bytes.isascii() checks a machine word of high bits at a time in C, so the
+    common all-ASCII case (e.g. subprocess stdout) never loops per byte.
+    """
+    if data.isascii():
+        return -1
+    return _NON_ASCII_BYTES_RE.search(data).start()
+
+
 def sanitize_for_cli(content: str) -> str:
     """Convenience function for CLI-safe sanitization."""
     return ascii_guardrails.sanitize_content(content, mode="replace")
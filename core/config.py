@@ -7,13 +7,64 @@ Handles loading and validation of system configuration settings.
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, validator
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Default providers.json written on first run. All routes default to claude.
+# Phase 2: Additional models are added as extra slots using the wrapper
+# template, e.g. "gemini": {"cmd": ["gemini", "prompt"], "extra_args":
+# ["--model", "gemini-1.5-pro"], ...} or "gpt": {"cmd": ["gpt", "chat"], ...}
+_DEFAULT_CONFIG_JSON = """{
+  "project_dir": "projects",
+  "logs_dir": "logs",
+  "default_timeout": 300,
+  "max_parallel_tasks": 1,
+  "slots": {
+    "claude": {
+      "cmd": [
+        "python",
+        "wrappers/claude_wrapper.py"
+      ],
+      "extra_args": [
+        "--model",
+        "claude-3.5-sonnet"
+      ],
+      "json_markers": [
+        "BEGIN_JSON",
+        "END_JSON"
+      ],
+      "timeout": 300,
+      "max_retries": 3
+    }
+  },
+  "routing": {
+    "plan": "claude",
+    "python": "claude",
+    "backend": "claude",
+    "frontend": "claude",
+    "research": "claude",
+    "documentation": "claude",
+    "general": "claude"
+  },
+  "max_retries": 3,
+  "retry_delay": 1.0
+}"""
+
+# Parsed config files keyed by (device, inode) -> ((mtime, size), data)
+_CONFIG_CACHE: Dict[Tuple[int, int], Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
 
 class ProviderConfig(BaseModel):
     """Configuration for a single LLM provider."""
     
+    model_config = ConfigDict(frozen=True)
+    
     cmd: list[str] = Field(..., description="Command array for CLI execution")
     extra_args: list[str] = Field(default_factory=list, description="Additional command arguments")
     json_markers: list[str] = Field(default=["BEGIN_JSON", "END_JSON"], description="JSON output markers")
@@ -24,6 +75,8 @@ class ProviderConfig(BaseModel):
 class RoutingConfig(BaseModel):
     """Task routing configuration mapping task types to models."""
     
+    model_config = ConfigDict(frozen=True)
+    
     plan: str = Field(default="claude", description="Planning tasks")
     python: str = Field(default="claude", description="Python code tasks")
     backend: str = Field(default="claude", description="Backend development")
@@ -52,6 +105,9 @@ class Config(BaseModel):
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     retry_delay: float = Field(default=1.0, description="Base retry delay in seconds")
     
+    # Task type to provider mapping, with the routing object it was built from
+    _routing_cache: Optional[Tuple[RoutingConfig, Dict[str, str]]] = PrivateAttr(default=None)
+    
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
@@ -69,67 +125,44 @@ class Config(BaseModel):
         if config_path is None:
             config_path = Path("providers/providers.json")
             
-        if config_path.exists():
-            with open(config_path) as f:
-                config_data = json.load(f)
-                
-            # Convert slot configs to ProviderConfig objects
-            if 'slots' in config_data:
-                for slot_name, slot_config in config_data['slots'].items():
-                    config_data['slots'][slot_name] = ProviderConfig(**slot_config)
-                    
-            return cls(**config_data)
-        else:
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
             # Create default configuration with Claude focus
             return cls._create_default_config(config_path)
+        
+        # Reuse the parsed file until it changes. Validation still runs per
+        # call so every caller gets its own mutable Config.
+        key = (stat.st_dev, stat.st_ino)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is None or cached[0] != version:
+            config_data = _json_loads(config_path.read_bytes())
+            _CONFIG_CACHE[key] = (version, config_data)
+        else:
+            config_data = cached[1]
+            
+        # Nested slot and routing dicts are validated into their models here
+        return cls(**config_data)
     
     @classmethod
     def _create_default_config(cls, config_path: Path) -> 'Config':
         """Create default configuration focused on Claude."""
-        config = cls(
-            slots={
-                "claude": ProviderConfig(
-                    cmd=["python", "wrappers/claude_wrapper.py"],
-                    extra_args=["--model", "claude-3.5-sonnet"],
-                    json_markers=["BEGIN_JSON", "END_JSON"],
-                    timeout=300,
-                    max_retries=3
-                )
-                # Phase 2: Additional models will be added here using wrapper template:
-                # "gemini": ProviderConfig(
-                #     cmd=["gemini", "prompt"],
-                #     extra_args=["--model", "gemini-1.5-pro"],
-                #     json_markers=["BEGIN_JSON", "END_JSON"],
-                #     timeout=300,
-                #     max_retries=3
-                # ),
-                # "gpt": ProviderConfig(
-                #     cmd=["gpt", "chat"],
-                #     extra_args=["--model", "gpt-4"],
-                #     json_markers=["BEGIN_JSON", "END_JSON"], 
-                #     timeout=300,
-                #     max_retries=3
-                # )
-            },
-            routing=RoutingConfig()  # All routes default to claude
-        )
-        
-        # Save default config
+        # Save default config, then load it through the normal path
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            config_dict = config.model_dump()
-            # Convert ProviderConfig objects back to dicts for JSON serialization
-            for slot_name, slot_config in config_dict['slots'].items():
-                if hasattr(slot_config, 'model_dump'):
-                    config_dict['slots'][slot_name] = slot_config.model_dump()
-            json.dump(config_dict, f, indent=2, default=str)
-            
-        return config
+        config_path.write_text(_DEFAULT_CONFIG_JSON)
+        return cls.load(config_path)
     
     def get_provider_for_task(self, task_type: str) -> str:
         """Get the appropriate provider for a given task type."""
-        routing_dict = self.routing.model_dump()
-        return routing_dict.get(task_type, routing_dict['general'])
+        # RoutingConfig is frozen, so the map is stale only once routing is
+        # replaced, by assignment or by model_copy(update=...)
+        cached = self._routing_cache
+        if cached is None or cached[0] is not self.routing:
+            cached = (self.routing, self.routing.model_dump())
+            self._routing_cache = cached
+        routing_map = cached[1]
+        return routing_map.get(task_type, routing_map['general'])
     
     def get_provider_config(self, provider_name: str) -> Optional[ProviderConfig]:
         """Get configuration for a specific provider."""
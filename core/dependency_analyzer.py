@@ -5,15 +5,55 @@ Analyzes task dependencies to create optimal parallel execution groups
 while preventing deadlocks and maximizing concurrency opportunities.
 """
 
+from collections import OrderedDict, deque
+import heapq
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
-import networkx as nx
 from core.state import Task, TaskStatus
 from core.logger import get_logger
 
 logger = get_logger("dependency_analyzer")
 
+# Per-team estimation tables, shared by every group and analyzer
+
+# Team-specific complexity multipliers
+_TEAM_COMPLEXITY_MULTIPLIERS = {
+    "frontend": 1.0,
+    "backend": 1.2,
+    "qa": 0.8,        # QA tasks are more atomic in Phase 3
+    "research": 1.5,
+    "documentation": 0.7
+}
+
+# Team-based priority adjustments
+_TEAM_PRIORITIES = {
+    "frontend": 10,
+    "backend": 8,
+    "qa": 6,
+    "documentation": 4,
+    "research": 2
+}
+
+# Base duration estimates by team (in minutes)
+_TEAM_BASE_DURATIONS = {
+    "frontend": 8.0,
+    "backend": 10.0,
+    "qa": 5.0,        # Optimized in Phase 3
+    "documentation": 6.0,
+    "research": 12.0
+}
+
+# Resource estimates (normalized 0.0-1.0)
+_TEAM_RESOURCES = {
+    "frontend": {"tokens": 0.3, "memory": 0.2, "cpu": 0.3},
+    "backend": {"tokens": 0.4, "memory": 0.3, "cpu": 0.4},
+    "qa": {"tokens": 0.2, "memory": 0.1, "cpu": 0.2},
+    "documentation": {"tokens": 0.3, "memory": 0.1, "cpu": 0.2},
+    "research": {"tokens": 0.5, "memory": 0.2, "cpu": 0.3}
+}
+_DEFAULT_TEAM_RESOURCES = {"tokens": 0.3, "memory": 0.2, "cpu": 0.3}
+
 
 class ParallelStrategy(Enum):
     """Strategies for parallel task execution."""
@@ -25,6 +65,8 @@ class ParallelStrategy(Enum):
 @dataclass
 class TaskGroup:
     """Group of tasks that can execute in parallel."""
+    __slots__ = ('id', 'tasks', 'priority', 'estimated_duration', 'resource_requirements', 'dependencies')
+    
     id: str
     tasks: List[Task]
     priority: int
@@ -35,6 +77,11 @@ class TaskGroup:
     def __len__(self) -> int:
         return len(self.tasks)
     
+    @property
+    def team(self) -> Optional[str]:
+        """Team shared by the tasks in this group."""
+        return self.tasks[0].team if self.tasks else None
+    
     def get_total_complexity(self) -> float:
         """Calculate total complexity score for this group."""
         return sum(self._estimate_task_complexity(task) for task in self.tasks)
@@ -44,22 +91,15 @@ class TaskGroup:
         # Base complexity on description length and team type
         base_complexity = len(task.description) / 100.0
         
-        # Team-specific complexity multipliers
-        team_multipliers = {
-            "frontend": 1.0,
-            "backend": 1.2,
-            "qa": 0.8,        # QA tasks are more atomic in Phase 3
-            "research": 1.5,
-            "documentation": 0.7
-        }
-        
-        multiplier = team_multipliers.get(task.team, 1.0)
+        multiplier = _TEAM_COMPLEXITY_MULTIPLIERS.get(task.team, 1.0)
         return base_complexity * multiplier
 
 
 @dataclass
 class ParallelExecutionPlan:
     """Plan for parallel task execution."""
+    __slots__ = ('task_groups', 'execution_stages', 'estimated_total_time', 'max_concurrent_groups', 'resource_allocation')
+    
     task_groups: List[TaskGroup]
     execution_stages: List[List[TaskGroup]]  # Groups that can run simultaneously
     estimated_total_time: float
@@ -73,6 +113,24 @@ class ParallelExecutionPlan:
         return total_tasks / sequential_groups if sequential_groups > 0 else 1.0
 
 
+@dataclass
+class TaskGraph:
+    """Directed task dependency graph as adjacency sets (edge: dependency -> dependent)."""
+    tasks: Dict[str, Task]
+    successors: Dict[str, Set[str]]
+    predecessors: Dict[str, Set[str]]
+    
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self.tasks
+    
+    def __len__(self) -> int:
+        return len(self.tasks)
+    
+    def in_degree(self) -> Dict[str, int]:
+        """Number of in-graph dependencies per task."""
+        return {task_id: len(preds) for task_id, preds in self.predecessors.items()}
+
+
 class DependencyAnalyzer:
     """
     Analyzes task dependencies to create optimal parallel execution plans.
@@ -81,12 +139,18 @@ class DependencyAnalyzer:
     groups that can execute in parallel while respecting dependencies.
     """
     
+    # Max task sets remembered by get_parallelism_opportunities
+    _OPPORTUNITY_CACHE_SIZE = 32
+    
     def __init__(self, strategy: ParallelStrategy = ParallelStrategy.BALANCED):
         """Initialize dependency analyzer with execution strategy."""
         self.strategy = strategy
         self.max_group_size = self._get_max_group_size()
         self.max_concurrent_groups = self._get_max_concurrent_groups()
         
+        # Unchanged task sets reuse their summary instead of being replanned
+        self._opportunity_cache: "OrderedDict[Tuple, Dict[str, int]]" = OrderedDict()
+        
     def _get_max_group_size(self) -> int:
         """Get maximum tasks per group based on strategy."""
         return {
@@ -118,24 +182,27 @@ class DependencyAnalyzer:
         # Build dependency graph
         dependency_graph = self._build_dependency_graph(tasks)
         
-        # Validate graph for cycles
-        if not self._validate_dag(dependency_graph):
-            raise ValueError("Circular dependencies detected in task graph")
+        # Level tasks by dependency depth, validating graph for cycles in the
+        # same pass. Fully independent tasks can't form a cycle and all sit
+        # at level 0.
+        if any(task.dependencies for task in tasks):
+            dependency_levels = self._calculate_dependency_levels(tasks, dependency_graph)
+            if dependency_levels is None:
+                raise ValueError("Circular dependencies detected in task graph")
+        else:
+            dependency_levels = dict.fromkeys((task.id for task in tasks), 0)
         
         # Create task groups based on dependencies
-        task_groups = self._create_task_groups(tasks, dependency_graph)
+        task_groups = self._create_task_groups(tasks, dependency_levels)
         
         # Optimize groups for parallel execution
         optimized_groups = self._optimize_groups(task_groups, dependency_graph)
         
-        # Create execution stages
-        execution_stages = self._create_execution_stages(optimized_groups, dependency_graph)
-        
-        # Calculate resource allocation
-        resource_allocation = self._calculate_resource_allocation(optimized_groups)
-        
-        # Estimate execution time
-        estimated_time = self._estimate_execution_time(execution_stages)
+        # Create execution stages, with resource allocation and estimated
+        # execution time accumulated as groups are placed
+        execution_stages, resource_allocation, estimated_time = self._create_execution_stages(
+            optimized_groups, dependency_graph
+        )
         
         plan = ParallelExecutionPlan(
             task_groups=optimized_groups,
@@ -150,105 +217,88 @@ class DependencyAnalyzer:
         
         return plan
     
-    def _build_dependency_graph(self, tasks: List[Task]) -> nx.DiGraph:
+    def _build_dependency_graph(self, tasks: List[Task]) -> TaskGraph:
         """Build directed graph of task dependencies."""
-        graph = nx.DiGraph()
-        
         # Add all tasks as nodes
-        for task in tasks:
-            graph.add_node(task.id, task=task)
+        graph = TaskGraph(
+            tasks={task.id: task for task in tasks},
+            successors={task.id: set() for task in tasks},
+            predecessors={task.id: set() for task in tasks}
+        )
         
-        # Add dependency edges
+        # Add dependency edges, only for tasks in our list
         for task in tasks:
             for dep_id in task.dependencies:
-                if dep_id in [t.id for t in tasks]:  # Only add edges for tasks in our list
-                    graph.add_edge(dep_id, task.id)
+                if dep_id in graph.tasks:
+                    graph.successors[dep_id].add(task.id)
+                    graph.predecessors[task.id].add(dep_id)
         
         return graph
     
-    def _validate_dag(self, graph: nx.DiGraph) -> bool:
-        """Validate that graph is a directed acyclic graph (no cycles)."""
-        try:
-            nx.find_cycle(graph)
-            return False  # Cycle found
-        except nx.NetworkXNoCycle:
-            return True   # No cycle, valid DAG
-    
-    def _create_task_groups(self, tasks: List[Task], graph: nx.DiGraph) -> List[TaskGroup]:
+    def _create_task_groups(self, tasks: List[Task], dependency_levels: Dict[str, int]) -> List[TaskGroup]:
         """Create initial task groups based on dependencies and characteristics."""
         task_groups = []
-        grouped_tasks = set()
+        task_to_group: Dict[str, str] = {}  # Task ID -> ID of the group holding it
         
-        # Find tasks with no dependencies (can start immediately)
-        root_tasks = [task for task in tasks if not task.dependencies]
-        
-        # Group tasks by team and dependency level
-        team_groups = self._group_by_team(tasks)
-        dependency_levels = self._calculate_dependency_levels(tasks, graph)
+        # Group tasks by team, then by dependency level within team, keeping
+        # teams and levels in order of first appearance
+        team_groups: Dict[str, Dict[int, List[Task]]] = {}
+        for task in tasks:
+            team_groups.setdefault(task.team or "general", {}).setdefault(dependency_levels[task.id], []).append(task)
         
         group_id = 0
-        for team, team_tasks in team_groups.items():
-            # Further group by dependency level within team
-            level_groups = {}
-            for task in team_tasks:
-                level = dependency_levels[task.id]
-                if level not in level_groups:
-                    level_groups[level] = []
-                level_groups[level].append(task)
-            
+        for team, level_groups in team_groups.items():
             # Create groups for each level
             for level, level_tasks in level_groups.items():
                 # Split large groups
-                while level_tasks:
-                    group_tasks = level_tasks[:self.max_group_size]
-                    level_tasks = level_tasks[self.max_group_size:]
-                    
-                    if group_tasks:
-                        group = TaskGroup(
-                            id=f"group_{group_id}",
-                            tasks=group_tasks,
-                            priority=self._calculate_group_priority(group_tasks, level),
-                            estimated_duration=self._estimate_group_duration(group_tasks),
-                            resource_requirements=self._estimate_resource_requirements(group_tasks),
-                            dependencies=self._find_group_dependencies(group_tasks, task_groups)
-                        )
-                        task_groups.append(group)
-                        group_id += 1
-                        grouped_tasks.update(task.id for task in group_tasks)
+                for start in range(0, len(level_tasks), self.max_group_size):
+                    group_tasks = level_tasks[start:start + self.max_group_size]
+                    group = TaskGroup(
+                        id=f"group_{group_id}",
+                        tasks=group_tasks,
+                        priority=self._calculate_group_priority(group_tasks, level),
+                        estimated_duration=self._estimate_group_duration(group_tasks),
+                        resource_requirements=self._estimate_resource_requirements(group_tasks),
+                        dependencies=self._find_group_dependencies(group_tasks, task_to_group)
+                    )
+                    task_groups.append(group)
+                    task_to_group.update((task.id, group.id) for task in group_tasks)
+                    group_id += 1
         
         return task_groups
     
-    def _group_by_team(self, tasks: List[Task]) -> Dict[str, List[Task]]:
-        """Group tasks by team assignment."""
-        teams = {}
-        for task in tasks:
-            team = task.team or "general"
-            if team not in teams:
-                teams[team] = []
-            teams[team].append(task)
-        return teams
-    
-    def _calculate_dependency_levels(self, tasks: List[Task], graph: nx.DiGraph) -> Dict[str, int]:
-        """Calculate dependency level for each task (0 = no dependencies)."""
-        levels = {}
+    def _calculate_dependency_levels(self, tasks: List[Task], graph: TaskGraph) -> Optional[Dict[str, int]]:
+        """
+        Calculate dependency level for each task (0 = no dependencies).
         
-        def calculate_level(task_id: str) -> int:
-            if task_id in levels:
-                return levels[task_id]
-            
-            # Find the task
-            task = next((t for t in tasks if t.id == task_id), None)
-            if not task or not task.dependencies:
-                levels[task_id] = 0
-                return 0
-            
-            # Level is max dependency level + 1
-            max_dep_level = max(calculate_level(dep_id) for dep_id in task.dependencies)
-            levels[task_id] = max_dep_level + 1
-            return levels[task_id]
+        Returns:
+            Level per task ID, or None if the graph contains a cycle
+        """
+        # Dependencies outside the task list count as level 0, so a task
+        # waiting only on them starts at level 1
+        levels = {
+            task.id: 1 if any(dep_id not in graph for dep_id in task.dependencies) else 0
+            for task in tasks
+        }
         
-        for task in tasks:
-            calculate_level(task.id)
+        # Kahn's algorithm: a task's level is final once all its in-list
+        # dependencies have been visited, and tasks on a cycle never are
+        in_degree = graph.in_degree()
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        visited = 0
+        while queue:
+            task_id = queue.popleft()
+            visited += 1
+            next_level = levels[task_id] + 1
+            for successor in graph.successors[task_id]:
+                if next_level > levels[successor]:
+                    levels[successor] = next_level
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+        
+        if visited < len(graph):
+            return None
         
         return levels
     
@@ -261,33 +311,15 @@ class DependencyAnalyzer:
         
         base_priority = 100 - (level * 10)  # Earlier levels get higher priority
         
-        # Team-based priority adjustments
-        team_priorities = {
-            "frontend": 10,
-            "backend": 8,
-            "qa": 6,
-            "documentation": 4,
-            "research": 2
-        }
-        
-        team_bonus = max(team_priorities.get(task.team, 0) for task in tasks)
+        team_bonus = max(_TEAM_PRIORITIES.get(task.team, 0) for task in tasks)
         
         return base_priority + team_bonus
     
     def _estimate_group_duration(self, tasks: List[Task]) -> float:
         """Estimate execution duration for a task group."""
-        # Base duration estimates by team (in minutes)
-        base_durations = {
-            "frontend": 8.0,
-            "backend": 10.0,
-            "qa": 5.0,        # Optimized in Phase 3
-            "documentation": 6.0,
-            "research": 12.0
-        }
-        
         total_duration = 0.0
         for task in tasks:
-            base = base_durations.get(task.team, 8.0)
+            base = _TEAM_BASE_DURATIONS.get(task.team, 8.0)
             # Adjust for task complexity
             complexity_factor = len(task.description) / 50.0  # Longer descriptions = more complex
             complexity_factor = max(0.5, min(2.0, complexity_factor))  # Clamp between 0.5x and 2x
@@ -299,19 +331,10 @@ class DependencyAnalyzer:
     
     def _estimate_resource_requirements(self, tasks: List[Task]) -> Dict[str, float]:
         """Estimate resource requirements for a task group."""
-        # Resource estimates (normalized 0.0-1.0)
-        team_resources = {
-            "frontend": {"tokens": 0.3, "memory": 0.2, "cpu": 0.3},
-            "backend": {"tokens": 0.4, "memory": 0.3, "cpu": 0.4},
-            "qa": {"tokens": 0.2, "memory": 0.1, "cpu": 0.2},
-            "documentation": {"tokens": 0.3, "memory": 0.1, "cpu": 0.2},
-            "research": {"tokens": 0.5, "memory": 0.2, "cpu": 0.3}
-        }
-        
         resources = {"tokens": 0.0, "memory": 0.0, "cpu": 0.0}
         
         for task in tasks:
-            task_resources = team_resources.get(task.team, {"tokens": 0.3, "memory": 0.2, "cpu": 0.3})
+            task_resources = _TEAM_RESOURCES.get(task.team, _DEFAULT_TEAM_RESOURCES)
             for resource, amount in task_resources.items():
                 resources[resource] += amount
         
@@ -321,21 +344,19 @@ class DependencyAnalyzer:
         
         return {k: v * sharing_factor for k, v in resources.items()}
     
-    def _find_group_dependencies(self, group_tasks: List[Task], existing_groups: List[TaskGroup]) -> List[str]:
+    def _find_group_dependencies(self, group_tasks: List[Task], task_to_group: Dict[str, str]) -> List[str]:
         """Find which existing groups this group depends on."""
-        group_deps = set()
-        
-        for task in group_tasks:
-            for dep_id in task.dependencies:
-                # Find which group contains this dependency
-                for group in existing_groups:
-                    if any(t.id == dep_id for t in group.tasks):
-                        group_deps.add(group.id)
-                        break
+        # Dependencies outside the grouped tasks so far are ignored
+        group_deps = {
+            task_to_group[dep_id]
+            for task in group_tasks
+            for dep_id in task.dependencies
+            if dep_id in task_to_group
+        }
         
         return list(group_deps)
     
-    def _optimize_groups(self, groups: List[TaskGroup], graph: nx.DiGraph) -> List[TaskGroup]:
+    def _optimize_groups(self, groups: List[TaskGroup], graph: TaskGraph) -> List[TaskGroup]:
         """Optimize task groups for better parallel execution."""
         # Sort groups by priority
         groups.sort(key=lambda g: g.priority, reverse=True)
@@ -343,11 +364,16 @@ class DependencyAnalyzer:
         # Try to merge small groups that don't have conflicting dependencies
         optimized = []
         
+        # Merge candidates per team, in the order they were kept. Groups from
+        # different teams never merge, and full groups can't take more tasks.
+        open_groups: Dict[Optional[str], List[TaskGroup]] = {}
+        
         for group in groups:
             merged = False
+            candidates = open_groups.setdefault(group.team, [])
             
             # Try to merge with existing compatible group
-            for existing in optimized:
+            for existing in candidates:
                 if self._can_merge_groups(group, existing, graph):
                     # Merge groups
                     existing.tasks.extend(group.tasks)
@@ -359,15 +385,19 @@ class DependencyAnalyzer:
                         existing.estimated_duration, 
                         group.estimated_duration
                     )
+                    if len(existing) >= self.max_group_size:
+                        candidates.remove(existing)
                     merged = True
                     break
             
             if not merged:
                 optimized.append(group)
+                if len(group) < self.max_group_size:
+                    candidates.append(group)
         
         return optimized
     
-    def _can_merge_groups(self, group1: TaskGroup, group2: TaskGroup, graph: nx.DiGraph) -> bool:
+    def _can_merge_groups(self, group1: TaskGroup, group2: TaskGroup, graph: TaskGraph) -> bool:
         """Check if two groups can be merged safely."""
         # Don't merge if total size would exceed limit
         if len(group1) + len(group2) > self.max_group_size:
@@ -380,13 +410,12 @@ class DependencyAnalyzer:
             return False
         
         # Don't merge if there are dependencies between the groups
-        group1_ids = {task.id for task in group1.tasks}
         group2_ids = {task.id for task in group2.tasks}
         
-        for task1_id in group1_ids:
-            for task2_id in group2_ids:
-                if graph.has_edge(task1_id, task2_id) or graph.has_edge(task2_id, task1_id):
-                    return False
+        for task in group1.tasks:
+            if not (graph.successors[task.id].isdisjoint(group2_ids)
+                    and graph.predecessors[task.id].isdisjoint(group2_ids)):
+                return False
         
         # Check resource compatibility
         merged_resources = self._merge_resources(
@@ -406,34 +435,87 @@ class DependencyAnalyzer:
             merged[resource] = merged.get(resource, 0.0) + amount
         return merged
     
-    def _create_execution_stages(self, groups: List[TaskGroup], graph: nx.DiGraph) -> List[List[TaskGroup]]:
-        """Create execution stages where groups in same stage can run in parallel."""
+    def _create_execution_stages(
+        self, 
+        groups: List[TaskGroup], 
+        graph: TaskGraph
+    ) -> Tuple[List[List[TaskGroup]], Dict[str, float], float]:
+        """
+        Create execution stages where groups in same stage can run in parallel.
+        
+        Returns:
+            (stages, resource_allocation, estimated_total_time) where the
+            allocation is the peak requirement of any single group and the
+            time sums the longest group duration of each stage
+        """
         stages = []
-        remaining_groups = groups.copy()
         completed_groups = set()
+        total_resources = {"tokens": 0.0, "memory": 0.0, "cpu": 0.0}
+        total_time = 0.0
         
-        while remaining_groups:
+        # Kahn-style bookkeeping: count unfinished dependencies per group and
+        # release dependents as their last dependency completes. Dependencies
+        # on groups that are not in the list (merged away) never complete.
+        position = {group.id: index for index, group in enumerate(groups)}
+        dependents: Dict[str, List[TaskGroup]] = {group.id: [] for group in groups}
+        pending: Dict[str, int] = {}
+        for group in groups:
+            pending[group.id] = len(group.dependencies)
+            for dep_id in group.dependencies:
+                if dep_id in dependents:
+                    dependents[dep_id].append(group)
+        
+        # Ready groups are ordered by (-priority, -locality, position). A
+        # group's locality (dependencies its team ran in the previous stage)
+        # can only be nonzero in the stage right after it is released, so
+        # those groups wait in a small sorted list and join the heap with
+        # locality 0 if they are not picked.
+        #
+        # A group needing more than the whole budget of some resource never
+        # fits next to anything and only runs alone in a stage where nothing
+        # else fits, so those wait in their own heap instead of being
+        # rescanned every stage.
+        too_large = {
+            group.id for group in groups
+            if any(amount > 1.0 for amount in group.resource_requirements.values())
+        }
+        ready = []
+        oversized = []
+        for group in groups:
+            if pending[group.id] == 0:
+                (oversized if group.id in too_large else ready).append((-group.priority, 0, position[group.id], group))
+        heapq.heapify(ready)
+        heapq.heapify(oversized)
+        released: List[Tuple[int, int, int, TaskGroup]] = []
+        next_remaining = 0
+        
+        while len(completed_groups) < len(groups):
             current_stage = []
             
-            # Find groups that can execute now (all dependencies completed)
-            ready_groups = []
-            for group in remaining_groups:
-                if all(dep_id in completed_groups for dep_id in group.dependencies):
-                    ready_groups.append(group)
-            
-            if not ready_groups:
+            if not ready and not released and not oversized:
                 # Shouldn't happen with valid DAG, but handle gracefully
                 logger.warning("No ready groups found, adding first remaining group")
-                ready_groups = [remaining_groups[0]]
-            
-            # Select groups for this stage (respect concurrency limits)
-            ready_groups.sort(key=lambda g: g.priority, reverse=True)
+                while groups[next_remaining].id in completed_groups:
+                    next_remaining += 1
+                group = groups[next_remaining]
+                released = [(-group.priority, 0, position[group.id], group)]
             
+            # Select groups for this stage (respect concurrency limits). Among
+            # equal priorities, prefer groups continuing a chain their team
+            # ran in the previous stage to keep related work on one agent.
             current_resources = {"tokens": 0.0, "memory": 0.0, "cpu": 0.0}
+            passed_over = []
+            released_index = 0
             
-            for group in ready_groups:
-                if len(current_stage) >= self.max_concurrent_groups:
+            while len(current_stage) < self.max_concurrent_groups:
+                if released_index < len(released) and (not ready or released[released_index] < ready[0]):
+                    entry = released[released_index]
+                    released_index += 1
+                elif ready:
+                    entry = heapq.heappop(ready)
+                else:
                     break
+                group = entry[-1]
                 
                 # Check if we have resources for this group
                 can_add = True
@@ -446,50 +528,77 @@ class DependencyAnalyzer:
                     current_stage.append(group)
                     for resource, amount in group.resource_requirements.items():
                         current_resources[resource] = current_resources.get(resource, 0.0) + amount
+                else:
+                    passed_over.append(entry)
             
             # If no groups could be added due to resource constraints, add highest priority group anyway
-            if not current_stage and ready_groups:
-                current_stage.append(ready_groups[0])
+            if not current_stage:
+                if oversized and (not passed_over or oversized[0] < passed_over[0]):
+                    current_stage.append(heapq.heappop(oversized)[-1])
+                else:
+                    current_stage.append(passed_over.pop(0)[-1])
             
             stages.append(current_stage)
             
-            # Mark groups as completed
+            # Stage time is the maximum duration of groups in that stage
+            total_time += max(group.estimated_duration for group in current_stage)
+            
+            # Unpicked groups stay ready without a locality preference
+            for priority, _, index, group in passed_over + released[released_index:]:
+                heapq.heappush(oversized if group.id in too_large else ready, (priority, 0, index, group))
+            
+            # Mark groups as completed and release their dependents
+            previous_by_team: Dict[Optional[str], Set[str]] = {}  # Team -> group IDs it ran this stage
+            newly_ready = []
             for group in current_stage:
-                remaining_groups.remove(group)
+                for resource, amount in group.resource_requirements.items():
+                    total_resources[resource] = max(total_resources.get(resource, 0.0), amount)
                 completed_groups.add(group.id)
-        
-        return stages
-    
-    def _calculate_resource_allocation(self, groups: List[TaskGroup]) -> Dict[str, float]:
-        """Calculate total resource allocation for the execution plan."""
-        total_resources = {"tokens": 0.0, "memory": 0.0, "cpu": 0.0}
-        
-        for group in groups:
-            for resource, amount in group.resource_requirements.items():
-                total_resources[resource] = max(total_resources.get(resource, 0.0), amount)
-        
-        return total_resources
-    
-    def _estimate_execution_time(self, stages: List[List[TaskGroup]]) -> float:
-        """Estimate total execution time for all stages."""
-        total_time = 0.0
-        
-        for stage in stages:
-            # Stage time is the maximum duration of groups in that stage
-            stage_time = max(group.estimated_duration for group in stage) if stage else 0.0
-            total_time += stage_time
-        
-        return total_time
+                previous_by_team.setdefault(group.team, set()).add(group.id)
+                for dependent in dependents[group.id]:
+                    pending[dependent.id] -= 1
+                    if pending[dependent.id] == 0 and dependent.id not in completed_groups:
+                        newly_ready.append(dependent)
+            
+            released = []
+            for group in newly_ready:
+                locality = sum(1 for dep_id in group.dependencies if dep_id in previous_by_team.get(group.team, ()))
+                entry = (-group.priority, -locality, position[group.id], group)
+                if locality:
+                    released.append(entry)
+                else:
+                    heapq.heappush(oversized if group.id in too_large else ready, entry)
+            released.sort()
+        
+        return stages, total_resources, total_time
     
     def get_parallelism_opportunities(self, tasks: List[Task]) -> Dict[str, int]:
         """Analyze parallelism opportunities in the task list."""
+        # The plan only depends on these task fields, their order and the
+        # strategy limits
+        key = (
+            self.max_group_size,
+            self.max_concurrent_groups,
+            tuple((task.id, task.team, len(task.description), tuple(task.dependencies)) for task in tasks)
+        )
+        cached = self._opportunity_cache.get(key)
+        if cached is not None:
+            self._opportunity_cache.move_to_end(key)
+            return dict(cached)
+        
         plan = self.analyze_dependencies(tasks)
         
-        return {
+        opportunities = {
             "total_tasks": len(tasks),
             "total_groups": len(plan.task_groups),
             "execution_stages": len(plan.execution_stages),
             "max_concurrent_groups": max(len(stage) for stage in plan.execution_stages) if plan.execution_stages else 0,
             "parallelism_factor": round(plan.get_parallelism_factor(), 2),
             "estimated_speedup": round(len(tasks) / plan.estimated_total_time * 5, 2)  # Assume 5min per task sequentially
-        }
\ No newline at end of file
+        }
+        
+        self._opportunity_cache[key] = opportunities
+        if len(self._opportunity_cache) > self._OPPORTUNITY_CACHE_SIZE:
+            self._opportunity_cache.popitem(last=False)
+        
+        return dict(opportunities)
\ No newline at end of file
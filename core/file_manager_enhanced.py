@@ -8,8 +8,10 @@ code extraction capabilities.
 
 import os
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import re
 import hashlib
 from datetime import datetime
@@ -19,6 +21,84 @@ from core.state import ProjectState
 
 logger = get_logger("file_manager_enhanced")
 
+# Extraction patterns, compiled once for every artifact processed
+
+# Markdown code blocks with optional language. The pattern has no letters
+# to fold; _generate_filename lowercases the language itself.
+_CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
+
+# HTML documents. Every match ends at a closing </html>, found last-first by
+# _HTML_END_RE, so text after it is never scanned.
+_HTML_END_RE = re.compile(r'.*</html>', re.DOTALL | re.IGNORECASE)
+_HTML_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r'<!DOCTYPE[^>]*>.*?</html>',
+    r'<html[^>]*>.*?</html>',
+    r'<(!DOCTYPE html>)?[^<]*<html[^>]*>.*?</html>'
+))
+
+# CSS selectors and rules. Every match ends at a closing brace. A selector
+# never matches from inside a word (the match at the word start is found
+# first), so the first pattern skips those starts instead of rescanning the
+# rest of the word from each one.
+_CSS_PATTERNS = tuple(re.compile(pattern, re.DOTALL) for pattern in (
+    r'((?:[.#]|(?<!\w))\w+\s*{[^}]*}(?:\s*[.#]?\w+\s*{[^}]*})*)',
+    r'(body\s*{[^}]*}(?:\s*[.#]?\w+\s*{[^}]*})*)',
+    r'(\*\s*{[^}]*}(?:\s*[.#]?\w+\s*{[^}]*})*)'
+))
+
+# JavaScript declarations and DOM/window statements, each with the keywords
+# a match must start with and the character every match ends at (None when
+# the match may end anywhere)
+_JS_PATTERNS = tuple((re.compile(pattern, re.DOTALL), keywords, terminator) for pattern, keywords, terminator in (
+    (r'((?:function\s+\w+|const\s+\w+|let\s+\w+|var\s+\w+)[^;]*(?:[^}]*})?[^;]*;?(?:\s*(?:function\s+\w+|const\s+\w+|let\s+\w+|var\s+\w+)[^;]*(?:[^}]*})?[^;]*;?)*)',
+     ('function', 'const', 'let', 'var'), None),
+    (r'(class\s+\w+[^}]*})', ('class',), '}'),
+    (r'(document\.\w+[^;]*;(?:[^;]*;)*)', ('document.',), ';'),
+    (r'(window\.\w+[^;]*;(?:[^;]*;)*)', ('window.',), ';')
+))
+
+# Code descriptions in permission-request replies
+_CODE_HINT_RE = re.compile(
+    r'(?:html|css|javascript|js).*?(?:code|content|implementation)[^:]*:?\s*([^.!?]*)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Characters not allowed in deliverable filenames, with a bytes translate
+# table applying the same replacement to all-ASCII names
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-_\.]')
+_UNSAFE_ASCII_TABLE = bytes(
+    ord('_') if code < 128 and _UNSAFE_FILENAME_RE.match(chr(code)) else code
+    for code in range(256)
+)
+
+# Content markers for file type detection, searched in priority order. ASCII
+# case folding matches the same text as searching content.lower() for these
+# markers, without copying the content.
+_TYPE_MARKERS = tuple((file_type, re.compile(pattern, re.IGNORECASE | re.ASCII)) for file_type, pattern in (
+    ('html', r'<html>|<!doctype'),
+    ('css', r'body \{|\* \{|[.#]'),
+    ('js', r'function\(|const |let |var '),
+    ('py', r'def ')
+))
+
+# Extensions for code block languages, and the filenames used for the first
+# file of each extension
+_EXTENSION_MAP = {
+    'html': '.html',
+    'css': '.css',
+    'javascript': '.js',
+    'js': '.js',
+    'python': '.py',
+    'py': '.py',
+    'text': '.txt'
+}
+_PREFERRED_NAMES = {
+    '.html': 'index.html',
+    '.css': 'styles.css',
+    '.js': 'script.js',
+    '.py': 'main.py'
+}
+
 
 class FileManagerEnhanced:
     """
@@ -28,6 +108,9 @@ class FileManagerEnhanced:
     actual deliverable files while maintaining security boundaries.
     """
     
+    # Max deliverable files written at once by create_deliverable_files
+    _WRITE_WORKERS = 8
+    
     def __init__(self, project_state: ProjectState, base_dir: Path):
         """Initialize enhanced file manager for a project."""
         self.project_state = project_state
@@ -39,6 +122,9 @@ class FileManagerEnhanced:
         self.deliverables_dir.mkdir(parents=True, exist_ok=True)
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
         
+        # Deliverables listing keyed by the directory mtime it was built at
+        self._deliverables_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        
         logger.info(f"Enhanced FileManager initialized for project {project_state.projectId}")
     
     def create_deliverable_file(
@@ -65,15 +151,53 @@ class FileManagerEnhanced:
         if file_type == "auto":
             file_type = self._detect_file_type(safe_filename, content)
         
+        return self._write_deliverable(safe_filename, content)
+    
+    def create_deliverable_files(self, files: List[Tuple[str, str]]) -> List[Path]:
+        """
+        Create several deliverable files, writing them concurrently.
+        
+        Args:
+            files: (filename, content) pairs; a later pair for the same file
+                replaces an earlier one, as with sequential writes
+            
+        Returns:
+            Paths of the files created, in input order (failures are logged
+            and left out)
+        """
+        safe_names = [self._sanitize_filename(filename) for filename, _ in files]
+        latest = dict(zip(safe_names, (content for _, content in files)))
+        if not latest:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(latest), self._WRITE_WORKERS)) as pool:
+            futures = {
+                safe_filename: pool.submit(self._write_deliverable, safe_filename, content)
+                for safe_filename, content in latest.items()
+            }
+        
+        written = {}
+        for safe_filename, future in futures.items():
+            if future.exception() is None:
+                written[safe_filename] = future.result()
+        
+        return [written[safe_filename] for safe_filename in safe_names if safe_filename in written]
+    
+    def _write_deliverable(self, safe_filename: str, content: str) -> Path:
+        """Write a deliverable file under an already sanitized name."""
         # Create file path
         file_path = self.deliverables_dir / safe_filename
         
+        # Overwriting a file leaves the directory mtime alone
+        self._deliverables_cache = None
+        
         try:
             # Write file with appropriate encoding
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             
-            logger.info(f"Created deliverable file: {safe_filename}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Created deliverable file: %s", safe_filename)
             return file_path
             
         except Exception as e:
@@ -113,11 +237,11 @@ class FileManagerEnhanced:
         """Extract code from markdown-style code blocks."""
         files = {}
         
-        # Pattern to match code blocks with language
-        pattern = r'```(\w+)?\n(.*?)\n```'
-        matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
+        if '```' not in content:
+            return files
         
-        for language, code in matches:
+        # Match code blocks with language
+        for language, code in _CODE_BLOCK_RE.findall(content):
             if code.strip():
                 filename = self._generate_filename(language or 'text', files)
                 files[filename] = code
@@ -128,16 +252,15 @@ class FileManagerEnhanced:
         """Extract HTML content from various formats."""
         files = {}
         
-        # Look for HTML patterns
-        html_patterns = [
-            r'<!DOCTYPE[^>]*>.*?</html>',
-            r'<html[^>]*>.*?</html>',
-            r'<(!DOCTYPE html>)?[^<]*<html[^>]*>.*?</html>'
-        ]
+        if '</' not in content:
+            return files
         
-        for pattern in html_patterns:
-            matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
+        # Look for HTML patterns, up to the last closing tag. Starts with no
+        # closing tag after them would otherwise each scan to the end.
+        last_close = _HTML_END_RE.match(content)
+        end = last_close.end() if last_close else 0
+        for pattern in _HTML_PATTERNS:
+            for match in pattern.findall(content, 0, end):
                 if match and len(match.strip()) > 50:
                     filename = self._generate_filename('html', files)
                     files[filename] = match
@@ -148,16 +271,10 @@ class FileManagerEnhanced:
         """Extract CSS content from various formats."""
         files = {}
         
-        # Look for CSS patterns (selectors and rules)
-        css_patterns = [
-            r'([.#]?\w+\s*{[^}]*}(?:\s*[.#]?\w+\s*{[^}]*})*)',
-            r'(body\s*{[^}]*}(?:\s*[.#]?\w+\s*{[^}]*})*)',
-            r'(\*\s*{[^}]*}(?:\s*[.#]?\w+\s*{[^}]*})*)'
-        ]
-        
-        for pattern in css_patterns:
-            matches = re.findall(pattern, content, re.DOTALL)
-            for match in matches:
+        # Look for CSS patterns (selectors and rules), up to the last closing brace
+        end = content.rfind('}') + 1
+        for pattern in _CSS_PATTERNS:
+            for match in pattern.findall(content, 0, end):
                 if match and len(match.strip()) > 30 and '{' in match and '}' in match:
                     filename = self._generate_filename('css', files)
                     files[filename] = match
@@ -168,17 +285,13 @@ class FileManagerEnhanced:
         """Extract JavaScript content from various formats."""
         files = {}
         
-        # Look for JavaScript patterns
-        js_patterns = [
-            r'((?:function\s+\w+|const\s+\w+|let\s+\w+|var\s+\w+)[^;]*(?:[^}]*})?[^;]*;?(?:\s*(?:function\s+\w+|const\s+\w+|let\s+\w+|var\s+\w+)[^;]*(?:[^}]*})?[^;]*;?)*)',
-            r'(class\s+\w+[^}]*})',
-            r'(document\.\w+[^;]*;(?:[^;]*;)*)',
-            r'(window\.\w+[^;]*;(?:[^;]*;)*)'
-        ]
-        
-        for pattern in js_patterns:
-            matches = re.findall(pattern, content, re.DOTALL)
-            for match in matches:
+        # Look for JavaScript patterns whose keywords appear, up to the last
+        # terminator they need
+        for pattern, keywords, terminator in _JS_PATTERNS:
+            if not any(keyword in content for keyword in keywords):
+                continue
+            end = content.rfind(terminator) + 1 if terminator else len(content)
+            for match in pattern.findall(content, 0, end):
                 if match and len(match.strip()) > 30:
                     filename = self._generate_filename('js', files)
                     files[filename] = match
@@ -199,8 +312,7 @@ class FileManagerEnhanced:
         ]):
             # Agent mentioned code but couldn't write it - try to extract any code snippets
             # Look for any structured content that looks like code
-            code_hints = re.findall(r'(?:html|css|javascript|js).*?(?:code|content|implementation)[^:]*:?\s*([^.!?]*)', 
-                                  content, re.IGNORECASE | re.DOTALL)
+            code_hints = _CODE_HINT_RE.findall(content)
             
             for hint in code_hints:
                 if hint and len(hint.strip()) > 20:
@@ -220,35 +332,21 @@ class FileManagerEnhanced:
     
     def _generate_filename(self, language: str, existing_files: Dict[str, str]) -> str:
         """Generate appropriate filename based on language/type."""
-        extension_map = {
-            'html': '.html',
-            'css': '.css', 
-            'javascript': '.js',
-            'js': '.js',
-            'python': '.py',
-            'py': '.py',
-            'text': '.txt'
-        }
-        
-        extension = extension_map.get(language.lower(), f'.{language}' if language else '.txt')
+        extension = _EXTENSION_MAP.get(language.lower(), f'.{language}' if language else '.txt')
         
         # Use preferred filenames for first occurrence
-        preferred_names = {
-            '.html': 'index.html',
-            '.css': 'styles.css',
-            '.js': 'script.js',
-            '.py': 'main.py'
-        }
-        
-        if extension in preferred_names and preferred_names[extension] not in existing_files:
-            return preferred_names[extension]
-        
-        # Generate numbered filename if preferred name exists
-        base_name = f"code{extension}"
+        preferred_name = _PREFERRED_NAMES.get(extension)
+        if preferred_name is not None and preferred_name not in existing_files:
+            return preferred_name
+        
+        # Generate numbered filename if preferred name exists, appending each
+        # counter to the previous stem (code.js, code_1.js, code_1_2.js, ...)
+        stem = "code"
+        base_name = f"{stem}{extension}"
         counter = 1
         while base_name in existing_files:
-            name, ext = base_name.rsplit('.', 1)
-            base_name = f"{name}_{counter}.{ext}"
+            stem = f"{stem}_{counter}"
+            base_name = f"{stem}{extension}"
             counter += 1
             
         return base_name
@@ -271,62 +369,63 @@ class FileManagerEnhanced:
             logger.warning(f"Task {task_id} not found")
             return created_files
         
-        # Process each artifact
+        # Extract code from each artifact, then write all deliverables together
+        extracted_files = []
         for artifact_path_str in task.artifacts:
             artifact_path = Path(artifact_path_str)
             
-            if artifact_path.exists():
-                try:
-                    # Read artifact content
-                    with open(artifact_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Extract code from artifact with enhanced extraction
-                    extracted_code = self.extract_code_from_artifact(content)
-                    
-                    # Create deliverable files
-                    for filename, code in extracted_code.items():
-                        file_path = self.create_deliverable_file(filename, code)
-                        created_files.append(file_path)
-                        
-                        logger.info(f"Enhanced extraction: Created {filename} from task {task_id}")
+            try:
+                # Read artifact content, skipping artifacts that no longer exist
+                with open(artifact_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
                 
-                except Exception as e:
-                    logger.error(f"Failed to process artifact {artifact_path}: {e}")
+                # Extract code from artifact with enhanced extraction
+                extracted_files.extend(self.extract_code_from_artifact(content).items())
+            
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"Failed to process artifact {artifact_path}: {e}")
+        
+        # Create deliverable files
+        created_files = self.create_deliverable_files(extracted_files)
+        if logger.isEnabledFor(logging.INFO):
+            for file_path in created_files:
+                logger.info("Enhanced extraction: Created %s from task %s", file_path.name, task_id)
         
         return created_files
     
     def create_project_summary(self) -> Path:
         """Create a summary file with links to all deliverables."""
-        summary_content = f"""# Project: {self.project_state.objective}
+        summary_parts = [f"""# Project: {self.project_state.objective}
 
 **Project ID:** {self.project_state.projectId}
 **Status:** {self.project_state.status}
 **Created:** {datetime.fromtimestamp(self.project_state.createdAt)}
 
 ## Deliverable Files:
-"""
+"""]
         
         # List all deliverable files
         if self.deliverables_dir.exists():
-            for file_path in self.deliverables_dir.iterdir():
-                if file_path.is_file():
-                    relative_path = file_path.relative_to(self.project_dir)
-                    summary_content += f"- [{file_path.name}](./{relative_path})\n"
+            relative_dir = self.deliverables_dir.relative_to(self.project_dir)
+            with os.scandir(self.deliverables_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        summary_parts.append(f"- [{entry.name}](./{relative_dir / entry.name})\n")
         
-        summary_content += f"""
+        summary_parts.append("""
 ## Task Status:
-"""
+""")
         
         # List task completion status
         for task in self.project_state.tasks:
             status_icon = "[PASS]" if task.status == "complete" else "[PROGRESS]" if task.status == "in_progress" else "[PENDING]"
-            summary_content += f"- {status_icon} {task.description} ({task.team})\n"
+            summary_parts.append(f"- {status_icon} {task.description} ({task.team})\n")
         
         # Create summary file
         summary_path = self.project_dir / "README.md"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
+        summary_path.write_text(''.join(summary_parts), encoding='utf-8')
         
         logger.info("Created enhanced project summary")
         return summary_path
@@ -334,7 +433,10 @@ class FileManagerEnhanced:
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for safe creation."""
         # Remove potentially dangerous characters
-        filename = re.sub(r'[^\w\-_\.]', '_', filename)
+        if filename.isascii():
+            filename = filename.encode('ascii').translate(_UNSAFE_ASCII_TABLE).decode('ascii')
+        else:
+            filename = _UNSAFE_FILENAME_RE.sub('_', filename)
         
         # Ensure reasonable length
         if len(filename) > 100:
@@ -350,33 +452,39 @@ class FileManagerEnhanced:
     def _detect_file_type(self, filename: str, content: str) -> str:
         """Detect file type from filename and content."""
         filename_lower = filename.lower()
-        content_lower = content.lower()
-        
-        if filename_lower.endswith('.html') or '<html>' in content_lower or '<!doctype' in content_lower:
-            return 'html'
-        elif filename_lower.endswith('.css') or any(pattern in content_lower for pattern in ['body {', '* {', '.', '#']):
-            return 'css'
-        elif filename_lower.endswith('.js') or any(pattern in content_lower for pattern in ['function(', 'const ', 'let ', 'var ']):
-            return 'js'
-        elif filename_lower.endswith('.py') or 'def ' in content_lower:
-            return 'py'
-        else:
-            return 'text'
+        
+        for file_type, marker_re in _TYPE_MARKERS:
+            if filename_lower.endswith('.' + file_type) or marker_re.search(content):
+                return file_type
+        return 'text'
     
     def get_deliverables(self) -> List[Dict[str, Any]]:
         """Get list of all deliverable files with metadata."""
         deliverables = []
         
-        if self.deliverables_dir.exists():
-            for file_path in self.deliverables_dir.iterdir():
-                if file_path.is_file():
-                    stat = file_path.stat()
+        # Reuse the last listing until files are added, removed or written
+        # through this manager
+        try:
+            dir_mtime = self.deliverables_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return deliverables
+        
+        cached = self._deliverables_cache
+        if cached is not None and cached[0] == dir_mtime:
+            return [dict(deliverable) for deliverable in cached[1]]
+        
+        # Directory entries answer is_file from the listing itself
+        with os.scandir(self.deliverables_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
                     deliverables.append({
-                        'name': file_path.name,
-                        'path': str(file_path),
+                        'name': entry.name,
+                        'path': entry.path,
                         'size': stat.st_size,
                         'modified': stat.st_mtime,
-                        'type': self._detect_file_type(file_path.name, '')
+                        'type': self._detect_file_type(entry.name, '')
                     })
         
+        self._deliverables_cache = (dir_mtime, [dict(deliverable) for deliverable in deliverables])
         return deliverables
\ No newline at end of file
@@ -4,11 +4,17 @@ Logging Configuration for MAOS
 Provides structured logging with proper formatting and levels.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Background listener writing queued records to the console and log file
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -39,25 +45,46 @@ def setup_logging(
     logger = logging.getLogger("maos")
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers
+    # Remove existing handlers, flushing records queued for them
+    _stop_listener()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Logging calls only enqueue records; the listener thread does the writes
+    global _listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     return logger
 
 
+def _stop_listener() -> None:
+    """Write out queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module."""
     return logging.getLogger(f"maos.{name}")
\ No newline at end of file
@@ -9,9 +9,9 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Union
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 import asyncio
 import aiofiles
 from core.logger import get_logger
@@ -99,11 +99,25 @@ class ProjectState(BaseModel):
     agents: Dict[str, Agent] = Field(default_factory=dict)
     logs: List[LogEntry] = Field(default_factory=list)
     
+    # Completed task IDs for O(1) dependency checks (not persisted)
+    _completed_task_ids: Set[str] = PrivateAttr(default_factory=set)
+    
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
         validate_assignment = True
     
+    def model_post_init(self, __context: Any):
+        """Seed completed task index from loaded tasks."""
+        self._completed_task_ids = {
+            task.id for task in self.tasks if task.status == TaskStatus.COMPLETE
+        }
+    
+    @property
+    def completed_task_ids(self) -> Set[str]:
+        """IDs of tasks currently in COMPLETE status."""
+        return self._completed_task_ids
+    
     def update_timestamp(self):
         """Update the updatedAt timestamp."""
         self.updatedAt = datetime.now().timestamp()
@@ -118,11 +132,13 @@ class ProjectState(BaseModel):
         )
         self.logs.append(entry)
         self.update_timestamp()
-        logger.info(f"[{agent}] {message}")
+        logger.info("[%s] %s", agent, message)
     
     def add_task(self, task: Task):
         """Add a task to the project."""
         self.tasks.append(task)
+        if task.status == TaskStatus.COMPLETE:
+            self._completed_task_ids.add(task.id)
         self.update_timestamp()
         self.add_log_entry(LogLevel.INFO, "system", f"Task added: {task.description}")
     
@@ -131,6 +147,10 @@ class ProjectState(BaseModel):
         for task in self.tasks:
             if task.id == task_id:
                 task.status = status
+                if status == TaskStatus.COMPLETE:
+                    self._completed_task_ids.add(task_id)
+                else:
+                    self._completed_task_ids.discard(task_id)
                 if error:
                     task.error = error
                 self.update_timestamp()
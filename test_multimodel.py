@@ -15,7 +15,7 @@ from datetime import datetime, timezone
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.config import Config
+from core.config import Config, RoutingConfig
 from core.state import ProjectState, Task, TaskStatus
 from core.model_router import IntelligentModelRouter
 from providers.cli_client import CLIClient
@@ -206,6 +206,13 @@ def test_routing_configuration():
     print("\nFallback chains:")
     for primary, fallbacks in router.fallback_chains.items():
         print(f"  {primary} -> {fallbacks}")
+    
+    # Routing lookups must follow replaced routing, including on copies
+    original_frontend = config.get_provider_for_task("frontend")
+    updated = config.model_copy(update={"routing": RoutingConfig(frontend="gemini")})
+    assert updated.get_provider_for_task("frontend") == "gemini"
+    assert config.get_provider_for_task("frontend") == original_frontend
+    print("\nRouting copy with update: frontend -> gemini")
 
 
 async def test_fallback_behavior():